@@ -5,9 +5,21 @@ import sys
 from pathlib import Path
 from typing import List, Optional
 
+from explorastur.event_parser import format_events
 from explorastur.url_processor import ProcessingResult, URLEventProcessor
 
 
+def positive_int(value: str) -> int:
+  """Argparse type for options that must be an integer of at least 1."""
+  try:
+    number = int(value)
+  except ValueError:
+    raise argparse.ArgumentTypeError(f"invalid integer value: {value!r}") from None
+  if number < 1:
+    raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+  return number
+
+
 def format_result(result: ProcessingResult, format_type: str = "json") -> str:
   """Format a processing result for output."""
   if format_type == "json":
@@ -19,13 +31,8 @@ def format_result(result: ProcessingResult, format_type: str = "json") -> str:
     output.append(f"Error: {result.error}")
   else:
     output.append(f"Found {len(result.events)} events:")
-    for i, event in enumerate(result.events, 1):
-      event_dict = event.dict()
-      output.append(f"\nEvent {i}:")
-      output.append(f"  Title: {event_dict['title']}")
-      for field in ["date", "time", "location", "description"]:
-        if event_dict.get(field):
-          output.append(f"  {field.capitalize()}: {event_dict[field]}")
+    if result.events:
+      output.append("\n" + format_events(result.events, "console").rstrip())
 
   return "\n".join(output)
 
@@ -61,11 +68,18 @@ def main():
   parser.add_argument("--format", choices=["json", "console"], default="console",
                       help="Output format for single URL processing")
   parser.add_argument("--output", help="Output file for saving results")
+  parser.add_argument("--workers", type=positive_int,
+                      help="Number of URLs to process concurrently (default: LLM_MAX_WORKERS or 4)")
 
   args = parser.parse_args()
 
   # Initialize processor
-  processor = URLEventProcessor(api_base_url=args.llm_api) if args.llm_api else URLEventProcessor()
+  processor_kwargs = {}
+  if args.llm_api:
+    processor_kwargs["api_base_url"] = args.llm_api
+  if args.workers is not None:
+    processor_kwargs["max_workers"] = args.workers
+  processor = URLEventProcessor(**processor_kwargs)
 
   try:
     # Get URLs to process
@@ -74,7 +88,7 @@ def main():
       urls = [args.url]
     elif args.urls:
       with open(args.urls, "r", encoding="utf-8") as f:
-        urls = [line.strip() for line in f if line.strip()]
+        urls = [url for url in (line.strip() for line in f) if url]
     elif args.url_list:
       urls = args.url_list
 
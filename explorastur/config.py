@@ -1,14 +1,43 @@
 """Configuration settings for the Explorastur application."""
+import logging
 import os
 
 from dotenv import load_dotenv
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables from .env file if present
 load_dotenv()
 
+
+def _env_number(name, default, cast=int):
+  """Read a numeric setting from the environment, falling back to the default if invalid."""
+  raw = os.getenv(name)
+  if raw is None or not raw.strip():
+    return default
+  try:
+    return cast(raw)
+  except ValueError:
+    logger.warning("Ignoring invalid %s=%r, using default %s", name, raw, default)
+    return default
+
+
 # LLM API settings
 LLM_API_BASE_URL = os.getenv("LLM_API_BASE_URL", "http://192.168.1.216:1234/v1")
 
+# Number of URLs processed concurrently in batch mode
+MAX_WORKERS = _env_number("LLM_MAX_WORKERS", 4)
+
+# HTTP timeouts (seconds) and retry policy for transient LLM API failures
+LLM_TIMEOUT = _env_number("LLM_TIMEOUT", 60.0, float)
+LLM_CONNECT_TIMEOUT = _env_number("LLM_CONNECT_TIMEOUT", 5.0, float)
+MAX_RETRIES = _env_number("LLM_MAX_RETRIES", 3)
+RETRY_BACKOFF = _env_number("LLM_RETRY_BACKOFF", 0.5, float)  # Base delay, doubled after each failed attempt
+RETRY_AFTER_MAX = _env_number("LLM_RETRY_AFTER_MAX", 60.0, float)  # Upper bound on a server's Retry-After
+
+# System prompt sent with every extraction request
+SYSTEM_PROMPT = "You extract structured event information from web content."
+
 # Default prompt template for event extraction
 DEFAULT_PROMPT_TEMPLATE = """
 You are a helpful assistant that extracts structured event information from web content. Analyze the content at this URL and extract all upcoming events:
@@ -1,10 +1,20 @@
 """Module for parsing, validating, and formatting event data."""
+import html
 import json
-from datetime import datetime
+import logging
+import re
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, field_validator
 
+logger = logging.getLogger(__name__)
+
+_DIGIT_RE = re.compile(r"\d")
+# Only ;-terminated entities, so text like "Pop&reggae" isn't read as "&reg"
+_ENTITY_RE = re.compile(r"&(?:#\d+|#[xX][0-9a-fA-F]+|[A-Za-z][A-Za-z0-9]*);")
+
 
 class Event(BaseModel):
   """Model representing an event with validation."""
@@ -15,27 +25,49 @@ class Event(BaseModel):
   location: Optional[str] = None
   description: Optional[str] = None
 
+  @field_validator("title", "location", "description", mode="before")
+  @classmethod
+  def unescape_html(cls, v):
+    """Decode HTML entities the LLM may copy verbatim from page markup."""
+    if isinstance(v, str) and "&" in v:
+      return _ENTITY_RE.sub(lambda m: html.unescape(m.group(0)), v)
+    return v
+
   @field_validator("date", mode="before")
   @classmethod
   def validate_date(cls, v):
     """Validate and normalize date format if possible."""
-    if not v:
+    if not v or not isinstance(v, str):
       return v
 
-    # Try to parse and normalize date if it's in a recognizable format
+    return _normalize_date(v)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_date(value: str) -> str:
+  """Normalize a date string to ISO format, returning it unchanged if unrecognized."""
+  # Fast path: the prompt asks for ISO dates, so most values are already normalized
+  if len(value) == 10 and value[4] == "-" and value[7] == "-":
     try:
-      # Try different date formats
-      for fmt in ("%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y", "%d-%m-%Y", "%B %d, %Y"):
-        try:
-          parsed_date = datetime.strptime(v, fmt)
-          return parsed_date.strftime("%Y-%m-%d")  # Normalize to ISO format
-        except ValueError:
-          continue
-    except Exception:
-      # If we can't parse it, return as is
+      date.fromisoformat(value)
+      return value
+    except ValueError:
       pass
 
-    return v
+  # Every supported format contains digits, so free text like "Unknown" can't match
+  if not _DIGIT_RE.search(value):
+    return value
+
+  # Try different date formats and normalize if one is recognized
+  for fmt in ("%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y", "%d-%m-%Y", "%B %d, %Y"):
+    try:
+      parsed_date = datetime.strptime(value, fmt)
+      return parsed_date.strftime("%Y-%m-%d")  # Normalize to ISO format
+    except ValueError:
+      continue
+
+  # If we can't parse it, return as is
+  return value
 
 
 def parse_events(events_data: List[Dict[str, Any]]) -> List[Event]:
@@ -46,17 +78,23 @@ def parse_events(events_data: List[Dict[str, Any]]) -> List[Event]:
       events_data: List of event dictionaries from the LLM
 
   Returns:
-      List of validated Event objects
+      List of validated Event objects, without duplicates
   """
   validated_events = []
+  seen = set()
 
   for event_dict in events_data:
     try:
-      event = Event(**event_dict)
+      event = Event.model_validate(event_dict)
+      # Skip events the LLM listed more than once
+      key = (event.title, event.date, event.time, event.location)
+      if key in seen:
+        continue
+      seen.add(key)
       validated_events.append(event)
     except Exception as e:
       # Log the error but continue processing other events
-      print(f"Error validating event: {e}")
+      logger.warning("Error validating event: %s", e)
 
   return validated_events
 
@@ -74,20 +112,20 @@ def format_events(events: List[Event], format_type: str = "json") -> str:
   """
   if format_type == "json":
     # Convert to JSON
-    return json.dumps([event.dict() for event in events], indent=2)
+    return json.dumps([event.model_dump() for event in events], indent=2)
 
   elif format_type == "console":
     # Format for console output
     output = []
 
     for i, event in enumerate(events, 1):
-      event_dict = event.dict()
       output.append(f"Event {i}:")
-      output.append(f"  Title: {event_dict['title']}")
+      output.append(f"  Title: {event.title}")
 
       for field in ["date", "time", "location", "description"]:
-        if event_dict.get(field):
-          output.append(f"  {field.capitalize()}: {event_dict[field]}")
+        value = getattr(event, field)
+        if value:
+          output.append(f"  {field.capitalize()}: {value}")
 
       output.append("")  # Empty line between events
 
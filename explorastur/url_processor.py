@@ -1,15 +1,55 @@
 """Module for processing URLs and extracting event information using LLM."""
 import json
-from dataclasses import dataclass
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
 import httpx
 
-from explorastur.config import DEFAULT_PROMPT_TEMPLATE, LLM_API_BASE_URL
+from explorastur.config import (
+    DEFAULT_PROMPT_TEMPLATE,
+    LLM_API_BASE_URL,
+    LLM_CONNECT_TIMEOUT,
+    LLM_TIMEOUT,
+    MAX_RETRIES,
+    MAX_WORKERS,
+    RETRY_AFTER_MAX,
+    RETRY_BACKOFF,
+    SYSTEM_PROMPT,
+)
 from explorastur.event_parser import Event, parse_events
 
+# Responses worth retrying: rate limiting and transient server-side failures
+_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Identical for every request, so built once rather than per call
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+  """Parse a Retry-After header given either as seconds or as an HTTP date."""
+  value = response.headers.get("Retry-After", "").strip()
+  if not value:
+    return None
+
+  # delay-seconds is a non-negative integer; anything else must be an HTTP date
+  if value.isdigit():
+    delay = int(value)
+  else:
+    try:
+      retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+      return None
+    if retry_at.tzinfo is None:
+      retry_at = retry_at.replace(tzinfo=timezone.utc)
+    delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+  return min(max(delay, 0.0), RETRY_AFTER_MAX)
+
 
 @dataclass
 class ProcessingResult:
@@ -17,13 +57,13 @@ class ProcessingResult:
   url: str
   events: List[Event]
   error: Optional[str] = None
-  processed_at: datetime = datetime.now()
+  processed_at: datetime = field(default_factory=datetime.now)
 
   def to_dict(self) -> Dict[str, Any]:
     """Convert result to dictionary format."""
     return {
         "url": self.url,
-        "events": [event.dict() for event in self.events],
+        "events": [event.model_dump() for event in self.events],
         "error": self.error,
         "processed_at": self.processed_at.isoformat()
     }
@@ -32,10 +72,25 @@ class ProcessingResult:
 class URLEventProcessor:
   """Process URLs to extract event information using LLM."""
 
-  def __init__(self, api_base_url: str = LLM_API_BASE_URL):
-    """Initialize the URL processor with LLM API settings."""
+  def __init__(self, api_base_url: str = LLM_API_BASE_URL, max_workers: int = MAX_WORKERS,
+               client: Optional[httpx.Client] = None, max_retries: int = MAX_RETRIES):
+    """
+    Initialize the URL processor with LLM API settings.
+
+    Args:
+        api_base_url: Base URL of the OpenAI-compatible LLM API
+        max_workers: Number of URLs processed concurrently in batch mode
+        client: Shared HTTP client to use; closing it stays with the caller
+        max_retries: Retries for transient LLM API failures, with exponential backoff
+    """
     self.api_base_url = api_base_url
-    self.client = httpx.Client(timeout=60.0)
+    self.max_workers = max(1, max_workers)
+    self.max_retries = max(0, max_retries)
+    self._completions_url = f"{api_base_url.rstrip('/')}/chat/completions"
+    self._owns_client = client is None
+    if client is None:
+      client = httpx.Client(timeout=httpx.Timeout(LLM_TIMEOUT, connect=LLM_CONNECT_TIMEOUT))
+    self.client = client
     self._validate_url = urlparse
 
   def _is_valid_url(self, url: str) -> bool:
@@ -46,25 +101,51 @@ class URLEventProcessor:
     except Exception:
       return False
 
+  def _post_with_retry(self, payload: Dict[str, Any]) -> httpx.Response:
+    """
+    POST to the LLM API, retrying connection failures and transient error responses.
+
+    Waits follow exponential backoff, unless the server sends a Retry-After header.
+    """
+    attempt = 0
+    while True:
+      delay = RETRY_BACKOFF * 2 ** attempt
+      try:
+        response = self.client.post(self._completions_url, json=payload)
+      except (httpx.ConnectError, httpx.ConnectTimeout, httpx.RemoteProtocolError):
+        if attempt >= self.max_retries:
+          raise
+      else:
+        if response.status_code not in _RETRY_STATUS_CODES or attempt >= self.max_retries:
+          response.raise_for_status()
+          return response
+        retry_after = _retry_after_seconds(response)
+        if retry_after is not None:
+          delay = retry_after
+
+      time.sleep(delay)
+      attempt += 1
+
   def _get_llm_response(self, url: str) -> List[Dict[str, Any]]:
     """Get event information from LLM for a given URL."""
     prompt = DEFAULT_PROMPT_TEMPLATE.format(url=url)
 
-    url = f"{self.api_base_url}/chat/completions"
     payload = {
         "model": "default",
         "messages": [
-            {"role": "system", "content": "You extract structured event information from web content."},
+            _SYSTEM_MESSAGE,
             {"role": "user", "content": prompt}
         ],
         "temperature": 0.1
     }
 
-    response = self.client.post(url, json=payload)
-    response.raise_for_status()
+    response = self._post_with_retry(payload)
 
     result = response.json()
     content = result["choices"][0]["message"]["content"]
+    if not content or not content.strip():
+      return []
+
     events = json.loads(content)
 
     if not isinstance(events, list):
@@ -96,14 +177,27 @@ class URLEventProcessor:
     """
     Process multiple URLs to extract events.
 
+    URLs are processed concurrently, since each one is dominated by waiting
+    on the LLM API. Duplicate URLs are only sent to the LLM once.
+
     Args:
         urls: List of URLs to process
 
     Returns:
-        List of ProcessingResult objects, one for each URL
+        List of ProcessingResult objects, one for each URL, in input order
     """
-    return [self.process_url(url) for url in urls]
+    unique_urls = list(dict.fromkeys(urls))
+
+    if self.max_workers == 1 or len(unique_urls) <= 1:
+      results = [self.process_url(url) for url in unique_urls]
+    else:
+      with ThreadPoolExecutor(max_workers=min(self.max_workers, len(unique_urls))) as executor:
+        results = list(executor.map(self.process_url, unique_urls))
+
+    results_by_url = dict(zip(unique_urls, results))
+    return [results_by_url[url] for url in urls]
 
   def close(self):
-    """Close the HTTP client."""
-    self.client.close()
+    """Close the HTTP client if it was created by this processor."""
+    if self._owns_client:
+      self.client.close()
@@ -0,0 +1,44 @@
+"""Tests for the command-line interface."""
+import io
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+from explorastur import cli
+from explorastur.url_processor import ProcessingResult
+
+
+class WorkersOptionTest(unittest.TestCase):
+
+  def run_main(self, *args):
+    argv = ["explorastur", "--url", "https://example.com/events", *args]
+    with mock.patch("sys.argv", argv), \
+         mock.patch.object(cli, "URLEventProcessor") as processor_cls:
+      processor_cls.return_value.process_url.return_value = ProcessingResult(
+          url="https://example.com/events", events=[])
+      with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()) as stderr:
+        try:
+          code = cli.main()
+        except SystemExit as e:
+          code = e.code
+    return code, stderr.getvalue(), processor_cls
+
+  def test_rejects_invalid_workers(self):
+    for value, message in (("0", "must be at least 1"), ("-3", "must be at least 1"),
+                           ("abc", "invalid integer value")):
+      with self.subTest(value=value):
+        code, stderr, processor_cls = self.run_main("--workers", value)
+
+        self.assertEqual(code, 2)
+        self.assertIn(message, stderr)
+        processor_cls.assert_not_called()
+
+  def test_passes_workers_to_processor(self):
+    code, _, processor_cls = self.run_main("--workers", "2")
+
+    self.assertEqual(code, 0)
+    processor_cls.assert_called_once_with(max_workers=2)
+
+
+if __name__ == "__main__":
+  unittest.main()
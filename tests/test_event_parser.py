@@ -0,0 +1,44 @@
+"""Tests for event validation and parsing."""
+import unittest
+
+from explorastur.event_parser import Event, parse_events
+
+
+class UnescapeHtmlTest(unittest.TestCase):
+
+  def test_decodes_terminated_entities(self):
+    event = Event(title="Teatro &amp; m&uacute;sica", location="Sala &#49;",
+                  description="Entrada &quot;libre&quot; &#x2014; m&aacute;s de dos horas")
+
+    self.assertEqual(event.title, "Teatro & música")
+    self.assertEqual(event.location, "Sala 1")
+    self.assertEqual(event.description, "Entrada \"libre\" — más de dos horas")
+
+  def test_leaves_unterminated_entities_alone(self):
+    for text in ("Pop&reggae", "Charla&para niños", "Sala&copy", "Rock&roll &reg"):
+      with self.subTest(text=text):
+        self.assertEqual(Event(title=text).title, text)
+
+
+class ParseEventsTest(unittest.TestCase):
+
+  def test_keeps_showings_at_different_times(self):
+    events = parse_events([
+        {"title": "A & B", "date": "2024-05-01", "time": "18:00", "location": "Teatro Campoamor"},
+        {"title": "A & B", "date": "2024-05-01", "time": "21:00", "location": "Teatro Campoamor"},
+    ])
+
+    self.assertEqual([event.time for event in events], ["18:00", "21:00"])
+
+  def test_collapses_same_date_in_different_formats(self):
+    events = parse_events([
+        {"title": "Mercado", "date": "01/05/2024", "location": "Plaza"},
+        {"title": "Mercado", "date": "2024-05-01", "location": "Plaza"},
+    ])
+
+    self.assertEqual(len(events), 1)
+    self.assertEqual(events[0].date, "2024-05-01")
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,122 @@
+"""Tests for URLEventProcessor retries and batch processing."""
+import json
+import threading
+import unittest
+from unittest import mock
+
+import httpx
+
+from explorastur.config import RETRY_BACKOFF
+from explorastur.url_processor import URLEventProcessor
+
+EVENTS_REPLY = {"choices": [{"message": {"content": json.dumps([{"title": "Concierto"}])}}]}
+
+
+class FlakyLLM:
+  """Mock transport handler that fails the first requests for each URL."""
+
+  def __init__(self, failures, status_code=503, headers=None):
+    self.failures = failures
+    self.status_code = status_code
+    self.headers = headers or {}
+    self.attempts = {}
+    self.lock = threading.Lock()
+
+  def __call__(self, request):
+    prompt = json.loads(request.content)["messages"][-1]["content"]
+    with self.lock:
+      attempt = self.attempts.get(prompt, 0)
+      self.attempts[prompt] = attempt + 1
+    if attempt < self.failures:
+      return httpx.Response(self.status_code, headers=self.headers)
+    return httpx.Response(200, json=EVENTS_REPLY)
+
+
+class RetryTest(unittest.TestCase):
+
+  def setUp(self):
+    sleep_patcher = mock.patch("explorastur.url_processor.time.sleep")
+    self.sleep = sleep_patcher.start()
+    self.addCleanup(sleep_patcher.stop)
+
+  def make_processor(self, handler, **kwargs):
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    self.addCleanup(client.close)
+    return URLEventProcessor(api_base_url="http://llm.test/v1", client=client, **kwargs)
+
+  def slept(self):
+    return [call.args[0] for call in self.sleep.call_args_list]
+
+  def test_backs_off_exponentially(self):
+    processor = self.make_processor(FlakyLLM(failures=2), max_retries=3)
+    result = processor.process_url("https://example.com/events")
+
+    self.assertIsNone(result.error)
+    self.assertEqual(len(result.events), 1)
+    self.assertEqual(self.slept(), [RETRY_BACKOFF, RETRY_BACKOFF * 2])
+
+  def test_honours_retry_after_seconds(self):
+    handler = FlakyLLM(failures=1, status_code=429, headers={"Retry-After": "7"})
+    processor = self.make_processor(handler, max_retries=3)
+    result = processor.process_url("https://example.com/events")
+
+    self.assertIsNone(result.error)
+    self.assertEqual(self.slept(), [7.0])
+
+  def test_ignores_invalid_retry_after(self):
+    for value in ("nan", "inf", "-5", "1.5", "soon"):
+      with self.subTest(value=value):
+        self.sleep.reset_mock()
+        handler = FlakyLLM(failures=1, status_code=503, headers={"Retry-After": value})
+        processor = self.make_processor(handler, max_retries=3)
+        result = processor.process_url("https://example.com/events")
+
+        self.assertIsNone(result.error)
+        self.assertEqual(self.slept(), [RETRY_BACKOFF])
+
+  def test_retry_after_date_in_the_past_does_not_wait(self):
+    handler = FlakyLLM(failures=1, status_code=429,
+                       headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    processor = self.make_processor(handler, max_retries=3)
+    processor.process_url("https://example.com/events")
+
+    self.assertEqual(self.slept(), [0.0])
+
+  def test_gives_up_after_max_retries(self):
+    processor = self.make_processor(FlakyLLM(failures=10), max_retries=2)
+    result = processor.process_url("https://example.com/events")
+
+    self.assertEqual(result.events, [])
+    self.assertIn("503", result.error)
+    self.assertEqual(len(self.slept()), 2)
+
+  def test_retries_inside_worker_threads(self):
+    urls = [f"https://example.com/events/{i}" for i in range(5)]
+    processor = self.make_processor(FlakyLLM(failures=1), max_workers=4, max_retries=1)
+    results = processor.process_urls(urls)
+
+    self.assertEqual([result.url for result in results], urls)
+    self.assertTrue(all(result.error is None for result in results))
+    self.assertEqual(self.slept(), [RETRY_BACKOFF] * len(urls))
+
+
+class ProcessUrlsTest(unittest.TestCase):
+
+  def test_sends_each_distinct_url_once(self):
+    urls = ["https://a.example/events", "https://b.example/events", "https://a.example/events"]
+    for max_workers in (1, 4):
+      with self.subTest(max_workers=max_workers):
+        handler = FlakyLLM(failures=0)
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        self.addCleanup(client.close)
+        processor = URLEventProcessor(api_base_url="http://llm.test/v1", client=client,
+                                      max_workers=max_workers)
+        results = processor.process_urls(urls)
+
+        self.assertEqual(sum(handler.attempts.values()), 2)
+        self.assertEqual([result.url for result in results], urls)
+        self.assertTrue(all(len(result.events) == 1 for result in results))
+
+
+if __name__ == "__main__":
+  unittest.main()